@@ -1,4 +1,14 @@
-"""This module handles connection with the county dataframe classes."""
+"""This module handles connection with the county dataframe classes.
+
+It can also be run as a module to look up a batch of parcel IDs read
+from stdin, one per line. The package uses relative imports, so run it
+with `-m` from the folder that contains the package folder:
+
+    python -m FloridaPropertyData.county_property_data < parcel_ids.txt
+"""
+import sys
+import requests
+from playwright.sync_api import Error as PlaywrightError
 from .helpers import county_dataframe as county_df
 from .logger import logger
 
@@ -16,13 +26,17 @@ class ParcelDataCollection:
         "charlotte": county_df.Charlotte,
     }
 
-    def __init__(self, parcel_id: str):
+    def __init__(self, parcel_id: str, county_hint: str = None):
         """Initialize a new ParcelDataCollection instance.
 
         Args:
             parcel_id (str): The parcel ID to search for.
+            county_hint (str): The county the parcel is most likely in.
+            It is searched first, so the other counties are only indexed
+            if the parcel is not found there.
         """
         self.parcel_id = parcel_id
+        self.county_hint = county_hint
         self.county_dataframe_class = self.get_county_dataframe_class()
         self.parcel_data = self.get_parcel_data()
 
@@ -33,10 +47,8 @@ class ParcelDataCollection:
             A county dataframe class if the parcel ID is found in one of the
             county dataframes, or None if it is not found in any of them.
         """
-        dataframe_dict = ParcelDataCollection.dataframe_classes.items()
-        for county, dataframe_class in dataframe_dict:
-            county_dataframe = dataframe_class.main_dataframe
-            if self.parcel_id in county_dataframe["Parcel ID"].unique():
+        for county, dataframe_class in self.get_search_order():
+            if self.parcel_id in dataframe_class.get_parcel_id_index():
                 logger.info(
                     "Parcel ID %r found in %r county.", self.parcel_id, county
                 )
@@ -47,10 +59,74 @@ class ParcelDataCollection:
             )
 
         logger.warning(
-            "Parcel ID %r not found in any county dataframe.", {self.parcel_id}
+            "Parcel ID %r not found in any county dataframe.", self.parcel_id
         )
         return None
 
+    @classmethod
+    def find_many(cls, parcel_ids: list) -> dict:
+        """Find the county dataframe class of several parcel IDs at once.
+
+        Each county's Parcel ID index is checked only for the parcel IDs
+        not found yet, and counties after the last match are never
+        indexed.
+
+        Args:
+            parcel_ids (list): The parcel IDs to search for.
+
+        Returns:
+            A dictionary mapping each parcel ID found in a county to that
+            county's dataframe class. Parcel IDs not found in any county
+            are left out.
+        """
+        remaining = set(parcel_ids)
+        county_classes = {}
+        for county, dataframe_class in cls.dataframe_classes.items():
+            if not remaining:
+                break
+
+            parcel_id_index = dataframe_class.get_parcel_id_index()
+            found = {
+                parcel_id
+                for parcel_id in remaining
+                if parcel_id in parcel_id_index
+            }
+            logger.info(
+                "%d of %d parcel IDs found in %r county.",
+                len(found),
+                len(remaining),
+                county,
+            )
+            county_classes.update(dict.fromkeys(found, dataframe_class))
+            remaining -= found
+
+        if remaining:
+            logger.warning(
+                "%d parcel IDs not found in any county dataframe.",
+                len(remaining),
+            )
+        return county_classes
+
+    def get_search_order(self) -> list:
+        """Return the county dataframe classes in the order to search them.
+
+        The hinted county, if any, comes first, followed by the other
+        counties in the order of `dataframe_classes`.
+
+        Returns:
+            A list of (county, county dataframe class) tuples.
+        """
+        dataframe_items = list(ParcelDataCollection.dataframe_classes.items())
+        if self.county_hint is None:
+            return dataframe_items
+
+        county_hint = self.county_hint.lower()
+        if county_hint not in ParcelDataCollection.dataframe_classes:
+            logger.warning("Unknown county hint %r ignored.", self.county_hint)
+            return dataframe_items
+
+        return sorted(dataframe_items, key=lambda item: item[0] != county_hint)
+
     def get_parcel_data(self) -> dict:
         """Retrieve the parcel data associated with the given parcel ID.
 
@@ -70,9 +146,49 @@ county dataframe not found",
             )
             return {}
 
-        parcel_data = self.county_dataframe_class.parcel_data
+        parcel_data = self.county_dataframe_class.parcel_data.as_dict()
         logger.info("Parcel data retrieved for parcel ID %r", self.parcel_id)
         self.links = self.county_dataframe_class.links
         self.county = self.county_dataframe_class.county
 
         return parcel_data
+
+
+def main(parcel_ids: list) -> None:
+    """
+    Prints the parcel data of every given parcel ID.
+
+    All lookups run in one process, so the county dataframes and indexes
+    are loaded once and shared by every parcel. A parcel whose lookup
+    fails, because its data can not be parsed or a county website can
+    not be reached, is reported as an error and the batch carries on.
+
+    Args:
+        parcel_ids: A list of parcel IDs to look up.
+    """
+    county_classes = ParcelDataCollection.find_many(parcel_ids)
+    for parcel_id in parcel_ids:
+        dataframe_class = county_classes.get(parcel_id)
+        if dataframe_class is None:
+            print(parcel_id, "not found", sep="\t")
+            continue
+
+        try:
+            parcel_data = dataframe_class(parcel_id).parcel_data.as_dict()
+        except (
+            AttributeError,
+            ValueError,
+            requests.RequestException,
+            PlaywrightError,
+        ):
+            logger.exception(
+                "Unable to retrieve parcel data for parcel ID %r", parcel_id
+            )
+            print(parcel_id, "error", sep="\t")
+            continue
+
+        print(parcel_id, dataframe_class.county, parcel_data, sep="\t")
+
+
+if __name__ == "__main__":
+    main([line.strip() for line in sys.stdin if line.strip()])
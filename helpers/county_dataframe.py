@@ -3,18 +3,20 @@ data in a standardized way.
 
 This module provides the `CountyDataframe` abstract base class, which
 defines a common interface for accessing county property data. To create
-a new county dataframe class, you should subclass this class and
-implement the abstract `find_parcel_data` method.
+a new county dataframe class, you should subclass this class, point it at
+the county's data files and implement the abstract `find_*_data` and
+`find_links` methods.
 
 The `CountyDataframe` class is intended to be used as a base class for
-specific county property dataframe classes. Each county dataframe class
-should implement the `find_parcel_data` method, which retrieves the
-parcel data associated with the parcel ID specified in the constructor
-and returns it as a dictionary. This module also provides concrete
+specific county property dataframe classes. Its `find_parcel_data`
+method finds the row of the parcel ID specified in the constructor and
+hands it to the `find_*_data` methods of the county dataframe class,
+which fill in the parcel data. This module also provides concrete
 county dataframe classes that extend the `CountyDataframe` base class
-and implement the `find_parcel_data` method for specific counties.
+for specific counties.
 
 Classes:
+    ParcelData: The parcel data found for a single parcel.
     CountyDataframe: An abstract base class representing a county
     property dataframe.
     Charlotte: A concrete county dataframe class for Charlotte County.
@@ -28,104 +30,331 @@ Raises:
 Attributes:
     data_folder (str): The path to the directory where county data is
     stored.
-    parcel_data_structure (dict): A dictionary that defines the
-    structure of the parcel data returned by the `find_parcel_data`
-    method of subclasses.
-
-Abstract methods:
-    find_parcel_data(self) -> dict: This abstract method retrieves the
-    parcel data associated with the parcel ID specified in the
-    constructor and returns it as a dictionary.
 
 Methods:
-    find_location_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    find_parcel_data(self) -> None: This method finds the row of the
+    parcel ID specified in the constructor and fills in the parcel data
+    from it.
+
+Abstract methods:
+    find_location_data(self, parcel_row: dict) -> None:
     This method finds and formats the address data for the parcel data
     dictionary.
 
-    find_subdivision_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    find_subdivision_data(self, parcel_row: dict) -> None:
     This method finds and formats the property type and subdivision data
     for the parcel data dictionary.
 
-    find_legal_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    find_legal_data(self, parcel_row: dict) -> None:
     This method finds and formats the legal description data for the
     parcel data dictionary.
 
 Concrete subclasses:
     Sarasota: A concrete county dataframe class for Sarasota County.
-    It provides an implementation for the abstract `find_parcel_data`
-    method specific to Sarasota County, and implements the methods
-    `find_location_data`, `find_subdivision_data`, and `find_legal_data`
-    to extract specific data for this county.
+    It implements the methods `find_location_data`,
+    `find_subdivision_data`, and `find_legal_data` to extract specific
+    data for this county.
 
 
 """
 from abc import ABC, abstractmethod
+import atexit
+from dataclasses import asdict, dataclass
+from functools import cached_property, lru_cache
 import os
-import re
+from urllib.parse import quote
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import BrowserContext, sync_playwright
 from ..helpers import misc, gzipconverter
 from ..logger import logger
 from ..config import COUNTY_DATABASE_DIR
 
 
+@dataclass(slots=True)
+class ParcelData:
+    """The parcel data found for a single parcel.
+
+    Every county dataframe object gets its own instance, so objects of
+    different parcels never share their data.
+    """
+
+    address_number: str = ""
+    street: str = ""
+    direction: str = ""
+    address: str = ""
+    city: str = ""
+    zip_code: str = ""
+    subdivision: str = ""
+    lot: str = ""
+    block: str = ""
+    unit: str = ""
+    plat_book: str = ""
+    plat_page: str = ""
+    property_type: str = ""
+    or_book: str = ""
+    or_page: str = ""
+    or_instrument: str = ""
+    legal_description: str = ""
+
+    def as_dict(self) -> dict:
+        """Return the parcel data as a dictionary.
+
+        Returns:
+            A dictionary mapping each field name to its value.
+        """
+        return asdict(self)
+
+
 class CountyDataframe(ABC):
     """Abstract base class representing a county property dataframe.
 
     This class defines an interface for accessing county property data.
     To create a new county dataframe class, you should subclass this
-    class and implement the abstract `find_parcel_data` method.
+    class, set the class attributes below and implement the abstract
+    `find_*_data` and `find_links` methods.
     """
 
-    parcel_data_structure = {
-        "address_number": "",
-        "street": "",
-        "direction": "",
-        "address": "",
-        "city": "",
-        "zip_code": "",
-        "subdivision": "",
-        "lot": "",
-        "block": "",
-        "unit": "",
-        "plat_book": "",
-        "plat_page": "",
-        "property_type": "",
-        "or_book": "",
-        "or_page": "",
-        "or_instrument": "",
-        "legal_description": "",
-    }
+    county: str = ""
+
     fema_url = "https://msc.fema.gov/portal/search?AddressQuery={}\
 #searchresultsanchor"
+    main_dataframe_path: str = ""
+    main_dataframe_sep: str = ","
+    categorical_columns: tuple = ()
+    subdivision_lookup_path: str = ""
+    subdivision_key_column: str = ""
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_main_dataframe(cls) -> pd.DataFrame:
+        """Load the main dataframe of the county.
+
+        The dataframe is only read from disk the first time it is needed,
+        so counties that are never queried never pay the parsing cost.
+        Columns listed in `categorical_columns` hold few distinct values
+        and are stored as categoricals to keep the dataframe small.
 
-    @abstractmethod
-    def find_parcel_data(self) -> None:
-        """Abstract method that retrieves the parcel data associated
-        with the parcel ID.
+        Returns:
+            The main dataframe containing parcel data.
+        """
+        logger.info("Loading %s", cls.main_dataframe_path)
+        dataframe = gzipconverter.GZIPConverter.open_df(
+            cls.main_dataframe_path, "gzip", cls.main_dataframe_sep
+        )
+        return dataframe.astype(
+            {column: "category" for column in cls.categorical_columns}
+        )
 
-        This method should retrieve the parcel data associated with the
-        parcel ID specified in the constructor and return it as a
-        dictionary.
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_subdivision_lookup_dataframe(cls) -> pd.DataFrame:
+        """Load the subdivision lookup dataframe of the county.
+
+        Returns:
+            The dataframe containing subdivision data.
+        """
+        logger.info("Loading %s", cls.subdivision_lookup_path)
+        return gzipconverter.GZIPConverter.open_df(
+            cls.subdivision_lookup_path, "gzip"
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_subdivision_index(cls) -> dict:
+        """Return the hash index of the subdivision lookup dataframe.
+
+        The index is keyed on `subdivision_key_column` and built once per
+        county, so finding the rows of a subdivision is a single dict
+        lookup instead of a scan over the whole lookup column.
+
+        Returns:
+            A dictionary mapping each subdivision code to the positions of
+            the rows it appears in.
+        """
+        return (
+            cls.get_subdivision_lookup_dataframe()
+            .groupby(cls.subdivision_key_column, sort=False)
+            .indices
+        )
+
+    def find_subdivision_rows(self, subdivision_code: str) -> pd.DataFrame:
+        """Return the subdivision lookup rows of a subdivision code.
+
+        Args:
+            subdivision_code (str): The code to look up.
+
+        Returns:
+            A dataframe holding every lookup row with the given code. It
+            is empty if the code is not in the lookup dataframe.
+        """
+        rows = self.subdivision_index.get(subdivision_code, [])
+        return self.subdivision_lookup_dataframe.iloc[rows]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_parcel_id_index(cls) -> dict:
+        """Return the Parcel ID hash index of the main dataframe.
+
+        Only the Parcel ID column is read to build the index, so checking
+        whether a parcel is in a county does not load the county's whole
+        main dataframe. The rows are read in the same order as
+        `get_main_dataframe`, so the positions in the index match it.
 
         Returns:
-            A dictionary containing the parcel data.
+            A dictionary mapping each Parcel ID to its row in the main
+            dataframe.
         """
+        logger.info("Indexing Parcel IDs of %s", cls.main_dataframe_path)
+        parcel_id_dataframe = gzipconverter.GZIPConverter.open_df(
+            cls.main_dataframe_path,
+            "gzip",
+            cls.main_dataframe_sep,
+            usecols=["Parcel ID"],
+        )
+        return cls.index_parcel_ids(parcel_id_dataframe)
+
+    @staticmethod
+    def index_parcel_ids(dataframe: pd.DataFrame) -> dict:
+        """Build a hash index of the Parcel ID column of a dataframe.
+
+        The index is built once per county, so checking for a parcel or
+        finding its row is a single dict lookup instead of a scan over the
+        whole Parcel ID column.
+
+        Args:
+            dataframe (pd.DataFrame): A dataframe with a "Parcel ID"
+            column.
+
+        Returns:
+            A dictionary mapping each Parcel ID to the position of the
+            first row it appears in.
+        """
+        parcel_ids = dataframe["Parcel ID"].drop_duplicates()
+        return dict(zip(parcel_ids, parcel_ids.index))
+
+    @staticmethod
+    def find_fema_link(parcel_data: ParcelData) -> str:
+        """Build the FEMA flood map search link of a parcel.
+
+        The address is percent-encoded, so characters such as "#", "&"
+        or "/" in an address can not break the query string.
+
+        Args:
+            parcel_data (ParcelData): The parcel data holding the address
+            and city of the parcel.
+
+        Returns:
+            The URL of the FEMA search for the parcel's address.
+        """
+        fema_address = quote(
+            f"{parcel_data.address} {parcel_data.city}", safe=""
+        )
+        return CountyDataframe.fema_url.format(fema_address)
+
+    @staticmethod
+    def find_deed_link(
+        parcel_data: ParcelData,
+        book_page_url: str,
+        instrument_url: str,
+    ) -> str:
+        """Build the deed link of a parcel.
+
+        The deed is looked up by book and page when both are known, and
+        by instrument number otherwise.
+
+        Args:
+            parcel_data (ParcelData): The parcel data holding the deed
+            references of the parcel.
+            book_page_url (str): The deed URL template taking a book and
+            a page.
+            instrument_url (str): The deed URL template taking an
+            instrument number.
+
+        Returns:
+            The URL of the deed, or an empty string if the parcel has no
+            deed reference.
+        """
+        if parcel_data.or_book and parcel_data.or_page:
+            return book_page_url.format(
+                parcel_data.or_book, parcel_data.or_page
+            )
+        if parcel_data.or_instrument:
+            return instrument_url.format(parcel_data.or_instrument)
+        return ""
+
+    @cached_property
+    def parcel_data(self) -> ParcelData:
+        """The parcel data of the parcel.
+
+        The data is only looked up the first time it is read, so building
+        a county object does not pay for the lookup.
+
+        Returns:
+            The ParcelData of the parcel.
+        """
+        # The find_*_data methods fill in self.parcel_data, so the empty
+        # instance is cached before they run, and dropped again if they
+        # fail so a partly filled instance is never returned.
+        self.__dict__["parcel_data"] = ParcelData()
+        try:
+            self.find_parcel_data()
+        except Exception:
+            del self.__dict__["parcel_data"]
+            raise
+        return self.__dict__["parcel_data"]
+
+    @cached_property
+    def links(self) -> dict:
+        """The links related to the parcel, found on first read.
+
+        Returns:
+            The dictionary returned by `find_links`.
+        """
+        return self.find_links()
+
+    def __init__(self, parcel_id: str):
+        """Initialize a new county dataframe object with the specified
+        parcel ID.
+
+        Args:
+            parcel_id (str): The parcel ID to retrieve data for.
+        """
+        self.parcel_id = parcel_id
+        self.main_dataframe = self.get_main_dataframe()
+        self.parcel_id_index = self.get_parcel_id_index()
+        self.subdivision_lookup_dataframe = (
+            self.get_subdivision_lookup_dataframe()
+        )
+        self.subdivision_index = self.get_subdivision_index()
+
+    def find_parcel_data(self) -> None:
+        """Retrieve parcel data associated with the specified parcel ID
+        and update parcel data dictionary.
+
+        Returns:
+            None.
+        """
+        row = self.parcel_id_index[self.parcel_id]
+        parcel_row = self.main_dataframe.iloc[row].to_dict()
+
+        self.find_location_data(parcel_row)
+        self.find_subdivision_data(parcel_row)
+        self.find_legal_data(parcel_row)
 
     @abstractmethod
-    def find_location_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_location_data(self, parcel_row: dict) -> None:
         """Abstract method that finds and formats address data for a
         given parcel."""
 
     @abstractmethod
-    def find_subdivision_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_subdivision_data(self, parcel_row: dict) -> None:
         """Abstract method that finds and formats property type and
         subdivision data for a given parcel."""
 
     @abstractmethod
-    def find_legal_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_legal_data(self, parcel_row: dict) -> None:
         """Abstract method that finds and formats legal description data
         for a given parcel."""
 
@@ -170,123 +399,118 @@ class Sarasota(CountyDataframe):
         main_dataframe_path (os.path): The path to the main dataframe
         file.
 
+        categorical_columns (tuple): Columns of the main dataframe with
+        few distinct values, stored as categoricals.
+
         subdivision_lookup_path (os.path): The path to the subdivision
         lookup file.
 
+        subdivision_key_column (str): The column of the subdivision
+        lookup file holding the subdivision code.
+
         main_dataframe (pd.DataFrame): The main dataframe containing
         parcel data.
 
+        parcel_id_index (dict): A hash index mapping each Parcel ID to
+        its row in the main dataframe.
+
         subdivision_lookup_dataframe (pd.DataFrame): The dataframe
         containing subdivision data.
+
+        subdivision_index (dict): A hash index mapping each subdivision
+        code to its rows in the subdivision lookup dataframe.
     """
 
+    county = "sarasota"
     county_data_folder = os.path.join(COUNTY_DATABASE_DIR, "sarasota")
 
     main_dataframe_path = os.path.join(
         county_data_folder, "Parcel_Sales_CSV", "Sarasota.gzip"
     )
 
-    subdivision_lookup_path = os.path.join(
-        county_data_folder, "SubDivisionIndex.gzip"
-    )
-
-    main_dataframe = gzipconverter.GZIPConverter.open_df(
-        main_dataframe_path, "gzip"
+    categorical_columns = (
+        "LOCS",
+        "LOCD",
+        "LOCCITY",
+        "LOCZIP",
+        "SUBD",
+        "BLOCK",
+        "LOT",
+        "UNIT",
+        "OR_BOOK",
+        "OR_PAGE",
+        "LEGAL2",
+        "LEGAL3",
+        "LEGAL4",
     )
 
-    subdivision_lookup_df = gzipconverter.GZIPConverter.open_df(
-        subdivision_lookup_path, "gzip"
+    subdivision_lookup_path = os.path.join(
+        county_data_folder, "SubDivisionIndex.gzip"
     )
 
-    def __init__(self, parcel_id: str):
-        """Initialize a new Sarasota county dataframe object with the
-        specified parcel ID.
-
-        Args:
-            parcel_id (str): The parcel ID to retrieve data for.
-
-        Raises:
-            ValueError: If an invalid parcel ID is provided.
-        """
-        self.parcel_id = parcel_id
-        self.county = "sarasota"
-        self.main_dataframe = Sarasota.main_dataframe
-        self.subdivision_lookup_dataframe = Sarasota.subdivision_lookup_df
-        self.parcel_data = CountyDataframe.parcel_data_structure
-        self.find_parcel_data()
-        self.links = self.find_links()
-
-    def find_parcel_data(self) -> None:
-        """Retrieve parcel data associated with the specified parcel ID
-        and update parcel data dictionary.
-
-        Returns:
-            None.
-        """
-        parcel_dataframe = self.main_dataframe.loc[
-            self.main_dataframe["Parcel ID"] == self.parcel_id
-        ]
+    subdivision_key_column = "Number"
 
-        self.find_location_data(parcel_dataframe)
-        self.find_subdivision_data(parcel_dataframe)
-        self.find_legal_data(parcel_dataframe)
+    appraiser_url = "https://www.sc-pa.com/propertysearch/parcel/details/{}"
+    appraiser_map_url = "https://ags3.scgov.net/scpa/?esearch={}&slayer=0"
+    clerk_of_court_url = "https://secure.sarasotaclerk.com/viewtiff.aspx?"
+    or_instrument_deed_url = clerk_of_court_url + "intrnum={}"
+    or_book_page_deed_url = clerk_of_court_url + "book={}&page={}"
+    subdivision_url = clerk_of_court_url + "intrnum=SUBDIVBK{}PG{}"
+    condo_url = clerk_of_court_url + "intrnum=CONDOBK{}PG{}"
 
-    def find_location_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_location_data(self, parcel_row: dict) -> None:
         """Extract and format location data for the parcel data
         dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): The dataframe containing
-            parcel data.
+            parcel_row (dict): The row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
-        address_number = misc.convert_to_string(parcel_dataframe["LOCN"])
-        street = misc.convert_to_string(parcel_dataframe["LOCS"])
-        direction = misc.convert_to_string(parcel_dataframe["LOCD"])
-        city = misc.convert_to_string(parcel_dataframe["LOCCITY"])
-        zip_code = misc.convert_to_string(parcel_dataframe["LOCZIP"])
+        address_number = misc.convert_to_string(parcel_row["LOCN"])
+        street = misc.convert_to_string(parcel_row["LOCS"])
+        direction = misc.convert_to_string(parcel_row["LOCD"])
+        city = misc.convert_to_string(parcel_row["LOCCITY"])
+        zip_code = misc.convert_to_string(parcel_row["LOCZIP"])
 
-        self.parcel_data["address_number"] = address_number
-        self.parcel_data["street"] = street
-        self.parcel_data["city"] = city
-        self.parcel_data["zip_code"] = zip_code
+        self.parcel_data.address_number = address_number
+        self.parcel_data.street = street
+        self.parcel_data.city = city
+        self.parcel_data.zip_code = zip_code
 
-        if direction != "NAN":
+        if direction:
             address = f"{address_number} {direction} {street}"
-            self.parcel_data["direction"] = direction
+            self.parcel_data.direction = direction
         else:
             address = f"{address_number} {street}"
-        self.parcel_data["address"] = address
+        self.parcel_data.address = address
 
-    def find_subdivision_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_subdivision_data(self, parcel_row: dict) -> None:
         """Extract and format subdivision data for the parcel data
         dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): The dataframe containing
-            parcel data.
+            parcel_row (dict): The row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
-        subdivision_code = misc.convert_to_string(parcel_dataframe["SUBD"])
+        subdivision_code = misc.convert_to_string(parcel_row["SUBD"])
         if subdivision_code:
-            while len(subdivision_code) < 4:
-                subdivision_code = f"0{subdivision_code}"
-            logger.info("Subdivision Code = %s", subdivision_code)
+            subdivision_code = subdivision_code.zfill(4)
+            logger.debug("Subdivision Code = %s", subdivision_code)
         else:
-            self.parcel_data["property_type"] = "Metes & Bounds"
+            self.parcel_data.property_type = "Metes & Bounds"
             return
 
-        subdivision_dataframe = self.subdivision_lookup_dataframe.loc[
-            self.subdivision_lookup_dataframe["Number"] == subdivision_code
-        ]
+        subdivision_dataframe = self.find_subdivision_rows(subdivision_code)
 
-        lot = misc.convert_to_string(parcel_dataframe["LOT"])
-        block = misc.convert_to_string(parcel_dataframe["BLOCK"])
-        unit = misc.convert_to_string(parcel_dataframe["UNIT"])
+        lot = misc.convert_to_string(parcel_row["LOT"])
+        block = misc.convert_to_string(parcel_row["BLOCK"])
+        unit = misc.convert_to_string(parcel_row["UNIT"])
         subdivision = misc.convert_to_string(subdivision_dataframe["Name"])
         plat_book = misc.convert_to_string(subdivision_dataframe["PlatBk1"])
         plat_page = misc.convert_to_string(subdivision_dataframe["PlatPg1"])
@@ -300,54 +524,54 @@ class Sarasota(CountyDataframe):
                 subdivision_dataframe["PlatPg2"]
             )
 
-        if lot != "NAN":
-            self.parcel_data["lot"] = lot
-        if block != "NAN":
-            self.parcel_data["block"] = block
+        if lot:
+            self.parcel_data.lot = lot
+        if block:
+            self.parcel_data.block = block
 
-        if subdivision != "NAN":
-            self.parcel_data["subdivision"] = subdivision
-            self.parcel_data["plat_book"] = plat_book
-            self.parcel_data["plat_page"] = plat_page
+        if subdivision:
+            self.parcel_data.subdivision = subdivision
+            self.parcel_data.plat_book = plat_book
+            self.parcel_data.plat_page = plat_page
 
-        if unit != "NAN":
-            self.parcel_data["property_type"] = "Condo"
-            self.parcel_data["unit"] = unit
+        if unit:
+            self.parcel_data.property_type = "Condo"
+            self.parcel_data.unit = unit
         else:
-            self.parcel_data["property_type"] = "Subdivision"
+            self.parcel_data.property_type = "Subdivision"
 
-    def find_legal_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_legal_data(self, parcel_row: dict) -> None:
         """Finds and formats legal data for the parcel data dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): A dataframe containing
-            parcel data.
+            parcel_row (dict): A row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
-        or_book = misc.convert_to_string(parcel_dataframe["OR_BOOK"])
-        or_page = misc.convert_to_string(parcel_dataframe["OR_PAGE"])
-        or_instrument = misc.convert_to_string(parcel_dataframe["LEGALREFER"])
+        or_book = misc.convert_to_string(parcel_row["OR_BOOK"])
+        or_page = misc.convert_to_string(parcel_row["OR_PAGE"])
+        or_instrument = misc.convert_to_string(parcel_row["LEGALREFER"])
         legal_description_columns = ["LEGAL1", "LEGAL2", "LEGAL3", "LEGAL4"]
-        legal_description = ""
-        for column in legal_description_columns:
-            line = misc.convert_to_string(parcel_dataframe[column])
-            if line:
-                legal_description = f"{legal_description} {line}"
-
-        legal_description = misc.convert_to_string(legal_description)
+        lines = [
+            misc.convert_to_string(parcel_row[column])
+            for column in legal_description_columns
+        ]
+        legal_description = " ".join(
+            line for line in lines if line
+        )
 
-        if or_book != "NAN":
-            self.parcel_data["or_book"] = or_book
+        if or_book:
+            self.parcel_data.or_book = or_book
 
-        if or_page != "NAN":
-            self.parcel_data["or_page"] = or_page
+        if or_page:
+            self.parcel_data.or_page = or_page
 
-        if or_instrument != "NAN":
-            self.parcel_data["or_instrument"] = or_instrument
+        if or_instrument:
+            self.parcel_data.or_instrument = or_instrument
 
-        self.parcel_data["legal_description"] = legal_description
+        self.parcel_data.legal_description = legal_description
 
     def find_links(self):
         """
@@ -384,45 +608,34 @@ class Sarasota(CountyDataframe):
             associated data passed to the method.
 
         """
-        appraiser_url = "https://www.sc-pa.com/propertysearch/parcel/\
-details/{}"
-        apraiser_map_url = "https://ags3.scgov.net/scpa/?esearch={}&slayer=0"
-        clerk_of_court_url = "https://secure.sarasotaclerk.com/viewtiff.aspx?"
-        or_instrument_deed_url = clerk_of_court_url + "intrnum={}"
-        or_book_page_deed_url = clerk_of_court_url + "book={}&page={}"
-        subdivision_url = clerk_of_court_url + "intrnum=SUBDIVBK{}PG{}"
-        condo_url = clerk_of_court_url + "intrnum=CONDOBK{}PG{}"
-
         parcel_id = self.parcel_id
         parcel_data = self.parcel_data
         links = {}
-        links["property appraiser"] = appraiser_url.format(parcel_id)
-        links["property map"] = apraiser_map_url.format(parcel_id)
+        links["property appraiser"] = self.appraiser_url.format(parcel_id)
+        links["property map"] = self.appraiser_map_url.format(parcel_id)
 
-        fema_address = f'{parcel_data["address"]}\
- {parcel_data["city"]}'.replace(
-            " ", "%20"
-        )
-        links["fema"] = CountyDataframe.fema_url.format(fema_address)
+        links["fema"] = CountyDataframe.find_fema_link(parcel_data)
 
-        or_book = parcel_data["or_book"]
-        is_condo = bool(parcel_data["unit"])
+        or_book = parcel_data.or_book
+        is_condo = bool(parcel_data.unit)
 
         if or_book:
-            or_page = parcel_data["or_page"]
-            links["deed"] = or_book_page_deed_url.format(or_book, or_page)
+            or_page = parcel_data.or_page
+            links["deed"] = self.or_book_page_deed_url.format(
+                or_book, or_page
+            )
         else:
-            or_inst = parcel_data["or_instrument"]
-            links["deed"] = or_instrument_deed_url.format(or_inst)
+            or_inst = parcel_data.or_instrument
+            links["deed"] = self.or_instrument_deed_url.format(or_inst)
 
         if is_condo:
-            links["condo"] = condo_url.format(
-                parcel_data["plat_book"], parcel_data["plat_page"]
+            links["condo"] = self.condo_url.format(
+                parcel_data.plat_book, parcel_data.plat_page
             )
         else:
-            if parcel_data["plat_book"]:
-                links["subdivision"] = subdivision_url.format(
-                    parcel_data["plat_book"], parcel_data["plat_page"]
+            if parcel_data.plat_book:
+                links["subdivision"] = self.subdivision_url.format(
+                    parcel_data.plat_book, parcel_data.plat_page
                 )
             else:
                 links["subdivision"] = None
@@ -445,175 +658,161 @@ class Manatee(CountyDataframe):
         main_dataframe_path (os.path): The path to the main dataframe
         file.
 
+        categorical_columns (tuple): Columns of the main dataframe with
+        few distinct values, stored as categoricals.
+
         subdivision_lookup_path (os.path): The path to the subdivision
         lookup file.
 
+        subdivision_key_column (str): The column of the subdivision
+        lookup file holding the subdivision code.
+
         main_dataframe (pd.DataFrame): The main dataframe containing
         parcel data.
 
+        parcel_id_index (dict): A hash index mapping each Parcel ID to
+        its row in the main dataframe.
+
         subdivision_lookup_dataframe (pd.DataFrame): The dataframe
         containing subdivision data.
+
+        subdivision_index (dict): A hash index mapping each subdivision
+        code to its rows in the subdivision lookup dataframe.
     """
 
+    county = "manatee"
     county_data_folder = os.path.join(COUNTY_DATABASE_DIR, "manatee")
 
     main_dataframe_path = os.path.join(county_data_folder, "manatee_ccdf.gzip")
 
-    subdivision_lookup_path = os.path.join(
-        county_data_folder, "subdivisions_in_manatee.gzip"
-    )
-
-    main_dataframe = gzipconverter.GZIPConverter.open_df(
-        main_dataframe_path, "gzip"
+    categorical_columns = (
+        "PAR_SUBDIV_BLOCK",
+        "PAR_SUBDIV_LOT",
+        "PAR_SUBDIV_NAME",
+        "PAR_SUBDIVISION",
+        "SITUS_PLACE_CODE",
+        "SITUS_POSTAL_CITY",
+        "SITUS_POSTAL_ZIP",
+        "SITUS_POSTDIR",
+        "SITUS_STREET_NAME",
+        "SITUS_STREET_SUF",
+        "SALE_BOOK_LAST",
     )
 
-    subdivision_lookup_df = gzipconverter.GZIPConverter.open_df(
-        subdivision_lookup_path, "gzip"
+    subdivision_lookup_path = os.path.join(
+        county_data_folder, "subdivisions_in_manatee.gzip"
     )
 
-    def __init__(self, parcel_id: str):
-        """Initialize a new Manatee county dataframe object with the
-        specified parcel ID.
-
-        Args:
-            parcel_id (str): The parcel ID to retrieve data for.
+    subdivision_key_column = "SUBDNUM"
 
-        Raises:
-            ValueError: If an invalid parcel ID is provided.
-        """
-        self.parcel_id = parcel_id
-        self.county = "manatee"
-        self.main_dataframe = Manatee.main_dataframe
-        self.subdivision_lookup_dataframe = Manatee.subdivision_lookup_df
-        self.parcel_data = CountyDataframe.parcel_data_structure
-        self.find_parcel_data()
-        self.links = self.find_links()
-
-    def find_parcel_data(self) -> None:
-        """Retrieve parcel data associated with the specified parcel ID
-        and update parcel data dictionary.
-
-        Returns:
-            None.
-        """
-        parcel_dataframe = self.main_dataframe.loc[
-            self.main_dataframe["Parcel ID"] == self.parcel_id
-        ]
-
-        self.find_location_data(parcel_dataframe)
-        self.find_subdivision_data(parcel_dataframe)
-        self.find_legal_data(parcel_dataframe)
-
-    def find_location_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_location_data(self, parcel_row: dict) -> None:
         """Extract and format location data for the parcel data
         dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): The dataframe containing
-            parcel data.
+            parcel_row (dict): The row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
         address_number = misc.convert_to_string(
-            parcel_dataframe["SITUS_ADDRESS_NUM"]
+            parcel_row["SITUS_ADDRESS_NUM"]
         )
         street_name = misc.convert_to_string(
-            parcel_dataframe["SITUS_STREET_NAME"]
+            parcel_row["SITUS_STREET_NAME"]
         )
         street_suffix = misc.convert_to_string(
-            parcel_dataframe["SITUS_STREET_SUF"]
+            parcel_row["SITUS_STREET_SUF"]
         )
         street = f"{street_name} {street_suffix}"
-        address = misc.convert_to_string(parcel_dataframe["SITUS_ADDRESS"])
-        city = misc.convert_to_string(parcel_dataframe["SITUS_POSTAL_CITY"])
-        zip_code = misc.convert_to_string(parcel_dataframe["SITUS_POSTAL_ZIP"])
-        direction = misc.convert_to_string(parcel_dataframe["SITUS_POSTDIR"])
+        address = misc.convert_to_string(parcel_row["SITUS_ADDRESS"])
+        city = misc.convert_to_string(parcel_row["SITUS_POSTAL_CITY"])
+        zip_code = misc.convert_to_string(parcel_row["SITUS_POSTAL_ZIP"])
+        direction = misc.convert_to_string(parcel_row["SITUS_POSTDIR"])
 
-        self.parcel_data["address_number"] = address_number
-        self.parcel_data["street"] = street
-        self.parcel_data["address"] = address
-        self.parcel_data["city"] = city
-        self.parcel_data["zip_code"] = zip_code
+        self.parcel_data.address_number = address_number
+        self.parcel_data.street = street
+        self.parcel_data.address = address
+        self.parcel_data.city = city
+        self.parcel_data.zip_code = zip_code
 
         if direction:
-            self.parcel_data["direction"] = direction
+            self.parcel_data.direction = direction
 
-    def find_subdivision_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_subdivision_data(self, parcel_row: dict) -> None:
         """Extract and format subdivision data for the parcel data
         dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): The dataframe containing
-            parcel data.
+            parcel_row (dict): The row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
         subdivision_code = misc.convert_to_string(
-            parcel_dataframe["PAR_SUBDIVISION"]
+            parcel_row["PAR_SUBDIVISION"]
         )
         if not subdivision_code:
-            self.parcel_data["property_type"] = "Metes & Bounds"
+            self.parcel_data.property_type = "Metes & Bounds"
             return
 
-        subdivision_dataframe = self.subdivision_lookup_dataframe.loc[
-            self.subdivision_lookup_dataframe["SUBDNUM"] == subdivision_code
-        ]
+        subdivision_dataframe = self.find_subdivision_rows(subdivision_code)
 
-        lot = misc.convert_to_string(parcel_dataframe["PAR_SUBDIV_LOT"])
-        block = misc.convert_to_string(parcel_dataframe["PAR_SUBDIV_BLOCK"])
+        lot = misc.convert_to_string(parcel_row["PAR_SUBDIV_LOT"])
+        block = misc.convert_to_string(parcel_row["PAR_SUBDIV_BLOCK"])
         subdivision = misc.convert_to_string(subdivision_dataframe["NAME"])
         plat_book = misc.convert_to_string(subdivision_dataframe["BOOK"])
         plat_page = misc.convert_to_string(subdivision_dataframe["PAGE"])
         property_type = misc.convert_to_string(subdivision_dataframe["TYPE"])
 
-        self.parcel_data["block"] = block
-        self.parcel_data["subdivision"] = subdivision
-        self.parcel_data["plat_book"] = plat_book
-        self.parcel_data["plat_page"] = plat_page
+        self.parcel_data.block = block
+        self.parcel_data.subdivision = subdivision
+        self.parcel_data.plat_book = plat_book
+        self.parcel_data.plat_page = plat_page
 
         if "CONDO" in property_type:
-            self.parcel_data["property_type"] = "Condo"
-            self.parcel_data["unit"] = lot
+            self.parcel_data.property_type = "Condo"
+            self.parcel_data.unit = lot
         else:
-            self.parcel_data["property_type"] = "Subdivision"
-            self.parcel_data["lot"] = lot
+            self.parcel_data.property_type = "Subdivision"
+            self.parcel_data.lot = lot
 
-    def find_legal_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_legal_data(self, parcel_row: dict) -> None:
         """Finds and formats legal data for the parcel data dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): A dataframe containing
-            parcel data.
+            parcel_row (dict): A row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
-        or_book = misc.convert_to_string(parcel_dataframe["SALE_BOOK_LAST"])
-        or_page = misc.convert_to_string(parcel_dataframe["SALE_PAGE_LAST"])
+        or_book = misc.convert_to_string(parcel_row["SALE_BOOK_LAST"])
+        or_page = misc.convert_to_string(parcel_row["SALE_PAGE_LAST"])
         or_instrument = misc.convert_to_string(
-            parcel_dataframe["SALE_INSTRNO_LAST"]
+            parcel_row["SALE_INSTRNO_LAST"]
         )
         legal_description_columns = ["PAR_LEGAL1", "PAR_LEGAL2", "PAR_LEGAL3"]
-        legal_description = ""
-        for column in legal_description_columns:
-            line = misc.convert_to_string(parcel_dataframe[column])
-            if line:
-                legal_description = f"{legal_description} {line}"
-
-        legal_description = misc.convert_to_string(legal_description)
+        lines = [
+            misc.convert_to_string(parcel_row[column])
+            for column in legal_description_columns
+        ]
+        legal_description = " ".join(
+            line for line in lines if line
+        )
 
         if or_book:
-            self.parcel_data["or_book"] = or_book
+            self.parcel_data.or_book = or_book
 
         if or_page:
-            self.parcel_data["or_page"] = or_page
+            self.parcel_data.or_page = or_page
 
         if or_instrument:
-            self.parcel_data["or_instrument"] = or_instrument
+            self.parcel_data.or_instrument = or_instrument
 
-        self.parcel_data["legal_description"] = legal_description
+        self.parcel_data.legal_description = legal_description
 
     def find_links(self) -> dict:
         """
@@ -654,24 +853,14 @@ OfficialRecords/Search/InstrumentBookPage/{}/{}/"
         links = {}
         links["property appraiser"] = appraiser_url.format(parcel_id)
         links["property map"] = ""
-        fema_address = f'{parcel_data["address"]}\
- {parcel_data["city"]}'.replace(
-            " ", "%20"
+        links["fema"] = CountyDataframe.find_fema_link(parcel_data)
+
+        plat_book = parcel_data.plat_book
+        plat_page = parcel_data.plat_page
+
+        links["deed"] = CountyDataframe.find_deed_link(
+            parcel_data, or_book_page_deed_url, or_instrument_deed_url
         )
-        links["fema"] = CountyDataframe.fema_url.format(fema_address)
-
-        or_book = parcel_data.get("or_book", "")
-        or_page = parcel_data.get("or_page", "")
-        or_inst = parcel_data.get("or_instrument", "")
-        plat_book = parcel_data.get("plat_book", "")
-        plat_page = parcel_data.get("plat_page", "")
-
-        if or_book and or_page:
-            links["deed"] = or_book_page_deed_url.format(or_book, or_page)
-        elif or_inst:
-            links["deed"] = or_instrument_deed_url.format(or_inst)
-        else:
-            links["deed"] = ""
 
         if plat_book:
             links["subdivision"] = subdivision_url.format(plat_book, plat_page)
@@ -696,31 +885,51 @@ class Charlotte(CountyDataframe):
         main_dataframe_path (os.path): The path to the main dataframe
         file.
 
+        categorical_columns (tuple): Columns of the main dataframe with
+        few distinct values, stored as categoricals.
+
+        main_dataframe_sep (str): The delimiter used in the main
+        dataframe file.
+
         subdivision_lookup_path (os.path): The path to the subdivision
         lookup file.
 
+        subdivision_key_column (str): The column of the subdivision
+        lookup file holding the subdivision code.
+
         main_dataframe (pd.DataFrame): The main dataframe containing
         parcel data.
 
+        parcel_id_index (dict): A hash index mapping each Parcel ID to
+        its row in the main dataframe.
+
         subdivision_lookup_dataframe (pd.DataFrame): The dataframe
         containing subdivision data.
+
+        subdivision_index (dict): A hash index mapping each subdivision
+        code to its rows in the subdivision lookup dataframe.
     """
 
+    county = "charlotte"
     county_data_folder = os.path.join(COUNTY_DATABASE_DIR, "charlotte")
 
     main_dataframe_path = os.path.join(county_data_folder, "cd.gzip")
 
-    main_dataframe = gzipconverter.GZIPConverter.open_df(
-        main_dataframe_path, "gzip", "|"
-    )
+    main_dataframe_sep = "|"
+
+    categorical_columns = ("streetname", "padZip", "SaleBook", "SalePage")
 
     subdivision_lookup_path = os.path.join(
         county_data_folder, "subdivisions.gzip"
     )
 
-    subdivision_lookup_df = gzipconverter.GZIPConverter.open_df(
-        subdivision_lookup_path, "gzip"
-    )
+    subdivision_key_column = "Designator"
+
+    plat_search_url = "https://clerkportal.charlotteclerk.com/PlatCondo\
+/PlatCondoIndex"
+    browser_timeout: int = 5000
+    browser_context: BrowserContext = None
+    session = requests.Session()
 
     def __init__(self, parcel_id: str):
         """Initialize a new Charlotte county dataframe object with the
@@ -732,76 +941,55 @@ class Charlotte(CountyDataframe):
         Raises:
             ValueError: If an invalid parcel ID is provided.
         """
-        self.parcel_id = parcel_id
-        self.county = "charlotte"
+        super().__init__(parcel_id)
         self.appraiser_link = f"https://www.ccappraiser.com/Show_Parcel.asp?\
 acct={parcel_id}%20%20&gen=T&tax=T&bld=T&oth=T&sal=T&lnd=T&leg=T"
-        self.main_dataframe = Charlotte.main_dataframe
-        self.subdivision_lookup_dataframe = Charlotte.subdivision_lookup_df
-        self.parcel_data = CountyDataframe.parcel_data_structure
-        self.find_parcel_data()
-        self.links = self.find_links()
 
-    def find_parcel_data(self) -> None:
-        """Retrieve parcel data associated with the specified parcel ID
-        and update parcel data dictionary.
-
-        Returns:
-            None.
-        """
-        parcel_dataframe = self.main_dataframe.loc[
-            self.main_dataframe["Parcel ID"] == self.parcel_id
-        ]
-
-        self.find_location_data(parcel_dataframe)
-        self.find_subdivision_data(parcel_dataframe)
-        self.find_legal_data(parcel_dataframe)
-
-    def find_location_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_location_data(self, parcel_row: dict) -> None:
         """Extract and format location data for the parcel data
         dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): The dataframe containing
-            parcel data.
+            parcel_row (dict): The row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
         address_number = misc.convert_to_string(
-            parcel_dataframe["streetnumber"]
+            parcel_row["streetnumber"]
         )
-        street_name = misc.convert_to_string(parcel_dataframe["streetname"])
+        street_name = misc.convert_to_string(parcel_row["streetname"])
         if address_number:
             address = f"{address_number} {street_name}"
         else:
             address = street_name
         city = misc.convert_to_string(self.find_city())
-        zip_code = misc.convert_to_string(parcel_dataframe["padZip"])
+        zip_code = misc.convert_to_string(parcel_row["padZip"])
 
-        self.parcel_data["address_number"] = address_number
-        self.parcel_data["city"] = city
-        self.parcel_data["street"] = street_name
-        self.parcel_data["address"] = address
-        self.parcel_data["zip_code"] = zip_code
+        self.parcel_data.address_number = address_number
+        self.parcel_data.city = city
+        self.parcel_data.street = street_name
+        self.parcel_data.address = address
+        self.parcel_data.zip_code = zip_code
 
-    def find_subdivision_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_subdivision_data(self, parcel_row: dict) -> None:
         """Extract and format subdivision data for the parcel data
         dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): The dataframe containing
-            parcel data.
+            parcel_row (dict): The row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
         # The format of short_legal is subdivision, section, block, lot and
         # must adhere to the following layout: pch 011 1337 0002
-        short_legal = misc.convert_to_string(parcel_dataframe["shortlegal"])
-        logger.info("Legal Description = %s", short_legal)
+        short_legal = misc.convert_to_string(parcel_row["shortlegal"])
+        logger.debug("Legal Description = %s", short_legal)
         if "ZZZ" in short_legal:
-            self.parcel_data["property_type"] = "Metes & Bounds"
+            self.parcel_data.property_type = "Metes & Bounds"
             return
 
         subdivision_code = short_legal[:3]
@@ -809,23 +997,23 @@ acct={parcel_id}%20%20&gen=T&tax=T&bld=T&oth=T&sal=T&lnd=T&leg=T"
         block = short_legal[8:12].lstrip("0")
         lot = short_legal[13:17].lstrip("0")
 
-        subdivision_dataframe = self.subdivision_lookup_dataframe.loc[
-            self.subdivision_lookup_dataframe["Designator"] == subdivision_code
-        ]
+        subdivision_dataframe = self.find_subdivision_rows(subdivision_code)
 
-        mask = subdivision_dataframe["Subdivision Name"].str.contains(section)
+        mask = subdivision_dataframe["Subdivision Name"].str.contains(
+            section, regex=False
+        )
         subdivision_row = subdivision_dataframe[mask]
 
         subdivision = misc.convert_to_string(
             subdivision_row["Subdivision Name"]
         )
         if subdivision:
-            self.parcel_data["property_type"] = "Subdivision"
-            self.parcel_data["subdivision"] = subdivision
+            self.parcel_data.property_type = "Subdivision"
+            self.parcel_data.subdivision = subdivision
             try:
                 plat_book, plat_page = self.find_plat_information(subdivision)
-                self.parcel_data["plat_book"] = plat_book
-                self.parcel_data["plat_page"] = plat_page
+                self.parcel_data.plat_book = plat_book
+                self.parcel_data.plat_page = plat_page
             except ValueError as error:
                 logger.error(error)
                 # Handle the error here, such as by displaying a message
@@ -839,38 +1027,38 @@ acct={parcel_id}%20%20&gen=T&tax=T&bld=T&oth=T&sal=T&lnd=T&leg=T"
                     plat_page,
                 )
 
-        self.parcel_data["lot"] = lot
-        self.parcel_data["block"] = block
+        self.parcel_data.lot = lot
+        self.parcel_data.block = block
 
-    def find_legal_data(self, parcel_dataframe: pd.DataFrame) -> None:
+    def find_legal_data(self, parcel_row: dict) -> None:
         """Finds and formats legal data for the parcel data dictionary.
 
         Args:
-            parcel_dataframe (pd.DataFrame): A dataframe containing
-            parcel data.
+            parcel_row (dict): A row containing parcel data, keyed by
+            column name.
 
         Returns:
             None.
         """
-        or_book = misc.convert_to_string(parcel_dataframe["SaleBook"])
-        or_page = misc.convert_to_string(parcel_dataframe["SalePage"])
+        or_book = misc.convert_to_string(parcel_row["SaleBook"])
+        or_page = misc.convert_to_string(parcel_row["SalePage"])
         or_instrument = misc.convert_to_string(
-            parcel_dataframe["InstrumentNumber"]
+            parcel_row["InstrumentNumber"]
         )
         legal_description = misc.convert_to_string(
-            parcel_dataframe["longlegal"]
+            parcel_row["longlegal"]
         )
 
         if or_book:
-            self.parcel_data["or_book"] = or_book
+            self.parcel_data.or_book = or_book
 
         if or_page:
-            self.parcel_data["or_page"] = or_page
+            self.parcel_data.or_page = or_page
 
         if or_instrument:
-            self.parcel_data["or_instrument"] = or_instrument
+            self.parcel_data.or_instrument = or_instrument
 
-        self.parcel_data["legal_description"] = legal_description
+        self.parcel_data.legal_description = legal_description
 
     def find_city(self):
         """Extracts the city name from the property information page of
@@ -884,16 +1072,62 @@ acct={parcel_id}%20%20&gen=T&tax=T&bld=T&oth=T&sal=T&lnd=T&leg=T"
             requests.exceptions.RequestException: If an error occurs
             while fetching the property information page.
         """
-        url = self.appraiser_link
-        page = requests.get(url, timeout=5)
+        return Charlotte.fetch_city(self.appraiser_link)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def fetch_city(url: str) -> str:
+        """Fetches the city name from a property information page.
+
+        The result is cached per page, so looking up the same parcel
+        again does not fetch and parse the page again. Pages are fetched
+        through one shared session, which keeps the connection to the
+        appraiser site open between parcels.
+
+        Args:
+            url (str): The URL of the property information page.
+
+        Returns:
+            A string containing the name of the city where the property
+            is located.
+        """
+        page = Charlotte.session.get(url, timeout=5)
         soup = BeautifulSoup(page.content, "html.parser")
-        results = soup.find("strong", text=re.compile("Property City & Zip:"))
+        results = soup.find(
+            "strong",
+            string=lambda text: text and "Property City & Zip:" in text,
+        )
         return results.parent.parent.find_all("div")[1].text[:-6].strip()
 
-    def find_plat_information(self, subdivision_name: str) -> tuple[str, str]:
+    @classmethod
+    def get_browser_context(cls) -> BrowserContext:
+        """Return the browser context used for the plat lookups.
+
+        Chromium is launched the first time a plat is looked up and is
+        reused for every later lookup, instead of being started and shut
+        down for each one. It is closed when the process exits.
+
+        Returns:
+            The shared Playwright browser context.
+        """
+        if cls.browser_context is None:
+            playwright = sync_playwright().start()
+            atexit.register(playwright.stop)
+            browser = playwright.chromium.launch()
+            atexit.register(browser.close)
+            cls.browser_context = browser.new_context()
+            cls.browser_context.set_default_timeout(cls.browser_timeout)
+        return cls.browser_context
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def find_plat_information(cls, subdivision_name: str) -> tuple[str, str]:
         """Searches the Charlotte Clerk of Courts website for plat
         information for the given subdivision name.
 
+        Many parcels share a subdivision, so the result is cached per
+        subdivision name and the site is searched once for each.
+
         Args:
             subdivision_name (str): The name of the subdivision to
             search for.
@@ -907,38 +1141,25 @@ acct={parcel_id}%20%20&gen=T&tax=T&bld=T&oth=T&sal=T&lnd=T&leg=T"
             subdivision name.
 
         """
-        with sync_playwright() as playwright:
-            with playwright.chromium.launch() as browser:
-                with browser.new_context() as context:
-                    page = context.new_page()
-                    page.goto(
-                        "https://clerkportal.charlotteclerk.com/PlatCondo\
-/PlatCondoIndex"
-                    )
-                    page.locator(".k-header").get_by_role("listbox").click()
-                    page.locator("#searchPlatDroptDown_listbox").get_by_text(
-                        "Description"
-                    ).click()
-                    page.locator("#searchPlatText").fill(subdivision_name)
-                    page.locator("#searchPlatButton").click()
-                    page.wait_for_timeout(50)
-                    plat_book = (
-                        page.locator(".k-grid-content")
-                        .locator("td")
-                        .nth(1)
-                        .inner_text()
-                    )
-                    plat_page = (
-                        page.locator(".k-grid-content")
-                        .locator("td")
-                        .nth(2)
-                        .inner_text()
-                    )
-
-                    if not plat_book or not plat_page:
-                        raise ValueError("Unable to find plat information")
-
-                    return plat_book, plat_page
+        page = cls.get_browser_context().new_page()
+        try:
+            page.goto(cls.plat_search_url)
+            page.locator(".k-header").get_by_role("listbox").click()
+            page.locator("#searchPlatDroptDown_listbox").get_by_text(
+                "Description"
+            ).click()
+            page.locator("#searchPlatText").fill(subdivision_name)
+            page.locator("#searchPlatButton").click()
+            grid_cells = page.locator(".k-grid-content").locator("td")
+            grid_cells.first.wait_for(state="attached")
+            cells = grid_cells.all_inner_texts()
+        finally:
+            page.close()
+
+        if len(cells) < 3 or not cells[1] or not cells[2]:
+            raise ValueError("Unable to find plat information")
+
+        return cells[1], cells[2]
 
     def find_links(self) -> dict:
         """
@@ -977,26 +1198,12 @@ mber=&inInstrumentNumber=&inLegal=&inDocumentTypeIds="
 
         parcel_id = self.parcel_id
         parcel_data = self.parcel_data
-        links = {}
-        links["property appraiser"] = appraiser_url.format(parcel_id)
-        links["property map"] = property_map_url.format(parcel_id)
-        fema_address = f'{parcel_data["address"]}\
- {parcel_data["city"]}'.replace(
-            " ", "%20"
-        )
-        links["fema"] = CountyDataframe.fema_url.format(fema_address)
-
-        or_book = parcel_data.get("or_book", "")
-        or_page = parcel_data.get("or_page", "")
-        or_inst = parcel_data.get("or_instrument", "")
-
-        if or_book and or_page:
-            links["deed"] = or_book_page_deed_url.format(or_book, or_page)
-        elif or_inst:
-            links["deed"] = or_instrument_deed_url.format(or_inst)
-        else:
-            links["deed"] = ""
-
-        links["subdivision"] = ""
-
-        return links
+        return {
+            "property appraiser": appraiser_url.format(parcel_id),
+            "property map": property_map_url.format(parcel_id),
+            "fema": CountyDataframe.find_fema_link(parcel_data),
+            "deed": CountyDataframe.find_deed_link(
+                parcel_data, or_book_page_deed_url, or_instrument_deed_url
+            ),
+            "subdivision": "",
+        }
@@ -1,6 +1,13 @@
 """This module handles downloading and unzipping county dataframe files."""
+import json
 import os
-import urllib.request
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..helpers import unzipper
 from ..logger import logger
 from ..config import COUNTY_DATABASE_DIR
@@ -10,6 +17,15 @@ class Downloader:
     """This class handles file downloading"""
 
     data_folder: str = COUNTY_DATABASE_DIR
+    max_workers: int = 8
+    chunk_size: int = 1 << 20
+    spool_max_size: int = 4 << 20
+    unzip_workers: int = 2
+    timeout: int = 60
+    max_retries: int = 3
+    download_state_path: str = os.path.join(
+        COUNTY_DATABASE_DIR, "download_state.json"
+    )
 
     def __init__(
         self: "Downloader", urls_to_download: dict, files_to_keep: dict
@@ -47,7 +63,8 @@ class Downloader:
         Returns:
             A string representing the file type.
         """
-        file_type = url.split(".")[-1]
+        url_path = urlparse(url).path
+        file_type = os.path.splitext(url_path)[1].lstrip(".")
         return file_type
 
     def get_file_download_path(
@@ -56,6 +73,10 @@ class Downloader:
         """
         Generates and returns the path to download a file.
 
+        Files are named after the URL they come from, so that several
+        files for the same county can be downloaded at the same time
+        without overwriting each other.
+
         Args:
             county_data_path: A string representing the path to the
             county's County Dataframes folder.
@@ -64,18 +85,24 @@ class Downloader:
         Returns:
             A string representing the path to download the file.
         """
-        if download_url.lower().endswith("zip"):
-            file_name: str = "Temp.zip"
-        else:
-            file_name: str = download_url.split("/")[-1]
+        file_name: str = os.path.basename(urlparse(download_url).path)
         file_download_path = os.path.join(county_data_path, file_name)
         return file_download_path
 
     def download(self: "Downloader") -> None:
         """
         Downloads the files from the URLs in the downloader object.
-        """
 
+        The files are downloaded concurrently, so the total download time
+        is bound by the slowest file instead of the sum of all of them.
+        Zip files are extracted as soon as their download completes,
+        without being written to the county folder first.
+        Files that have not changed on the server since the last run are
+        not downloaded again, as long as the files they produced are still
+        on disk.
+        """
+        download_state: dict = Downloader.load_download_state()
+        download_tasks = []
         for county in self.urls_to_download:
             county_data_path = self.get_county_data_path(county)
             logger.info("Downloading files for %s county", county)
@@ -84,27 +111,359 @@ class Downloader:
                 file_download_path = self.get_file_download_path(
                     county_data_path, download_url
                 )
-                logger.debug(
-                    "Downloading file from %s to %s",
-                    download_url,
-                    file_download_path,
+                download_tasks.append(
+                    (
+                        county,
+                        download_url,
+                        file_download_path,
+                        county_data_path,
+                    )
                 )
 
-                with urllib.request.urlopen(download_url) as response:
-                    with open(file_download_path, "wb") as file:
-                        file.write(response.read())
-
-                if file_download_path.lower().endswith("zip"):
-                    logger.debug(
-                        "Unzipping %s to %s",
-                        file_download_path,
+        with ThreadPoolExecutor(
+            max_workers=Downloader.max_workers
+        ) as executor:
+            futures = {}
+            for task in download_tasks:
+                county, download_url, file_download_path, county_data_path = (
+                    task
+                )
+                validators = Downloader.get_usable_validators(
+                    download_state, download_url
+                )
+                file_extension = os.path.splitext(file_download_path)[1]
+                if file_extension.lower() == ".zip":
+                    future = executor.submit(
+                        self.download_archive,
+                        download_url,
                         county_data_path,
+                        validators,
                     )
-                    unzipper.Unzipper.unzip(
-                        file_download_path, county_data_path
+                else:
+                    future = executor.submit(
+                        self.download_file,
+                        download_url,
+                        file_download_path,
+                        validators,
                     )
+                futures[future] = (county, download_url)
+
+            for future in as_completed(futures):
+                state_entry = future.result()
+                county, download_url = futures[future]
+                if state_entry is None:
+                    continue
+                state_entry["outputs"] = [
+                    os.path.relpath(output, Downloader.data_folder)
+                    for output in state_entry["outputs"]
+                    if os.path.basename(output) in self.files_to_keep[county]
+                ]
+                download_state[download_url] = state_entry
+
+        Downloader.save_download_state(download_state)
+
+        for county in self.urls_to_download:
+            county_data_path = self.get_county_data_path(county)
             self.remove_unneeded_files(county, county_data_path)
 
+    @staticmethod
+    def get_usable_validators(download_state: dict, download_url: str) -> dict:
+        """
+        Returns the validators to send with the request for a URL.
+
+        Validators are only usable while every file the last download of
+        the URL produced is still on disk, either as downloaded or as its
+        converted gzip file. Otherwise the server could answer "not
+        modified" for data that no longer exists locally, and it would
+        never be fetched again.
+
+        Args:
+            download_state: The download state loaded by
+            `load_download_state`.
+            download_url: A string representing the URL to download.
+
+        Returns:
+            The "ETag" and "Last-Modified" headers of the last download of
+            the URL, or an empty dictionary if the URL must be downloaded
+            unconditionally.
+        """
+        state_entry = download_state.get(download_url, {})
+        outputs = state_entry.get("outputs")
+        if not outputs:
+            return {}
+
+        for output in outputs:
+            output_path = os.path.join(Downloader.data_folder, output)
+            converted_path = os.path.splitext(output_path)[0] + ".gzip"
+            if not (
+                os.path.exists(output_path) or os.path.exists(converted_path)
+            ):
+                logger.info(
+                    "%s is missing, downloading %s again",
+                    output_path,
+                    download_url,
+                )
+                return {}
+        return state_entry
+
+    @staticmethod
+    def load_download_state() -> dict:
+        """
+        Loads the validators the server sent for each downloaded URL.
+
+        Returns:
+            A dictionary mapping each URL to its "ETag" and
+            "Last-Modified" response headers, and to the "outputs" its
+            download produced, relative to `data_folder`. The dictionary
+            is empty if there is no download state yet, or if it can not
+            be read.
+        """
+        try:
+            with open(
+                Downloader.download_state_path, "r", encoding="utf-8"
+            ) as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError):
+            logger.info("No usable download state, downloading all files")
+            return {}
+
+    @staticmethod
+    def save_download_state(download_state: dict) -> None:
+        """
+        Saves the validators the server sent for each downloaded URL.
+
+        Args:
+            download_state: A dictionary mapping each URL to its "ETag"
+            and "Last-Modified" response headers and the "outputs" its
+            download produced.
+        """
+        with open(
+            Downloader.download_state_path, "w", encoding="utf-8"
+        ) as state_file:
+            json.dump(download_state, state_file, indent=4)
+
+    def download_file(
+        self: "Downloader",
+        download_url: str,
+        file_download_path: os.path,
+        validators: dict = None,
+    ) -> dict:
+        """
+        Downloads a single file to the given path.
+
+        The response is streamed to disk in fixed size chunks, so memory
+        use stays flat no matter how large the file is. Servers may send
+        the body gzip encoded, which is decoded while streaming.
+        The request is conditional on the validators of the last
+        download, so a file that has not changed is not sent again.
+
+        Args:
+            download_url: A string representing the URL to download.
+            file_download_path: A string representing the path to write
+            the downloaded file to.
+            validators: The "ETag" and "Last-Modified" headers of the last
+            download of the URL, if any.
+
+        Returns:
+            The "ETag" and "Last-Modified" headers of the response, and
+            the "outputs" list holding the downloaded file, or None if the
+            file has not changed since the last download.
+        """
+        logger.debug(
+            "Downloading file from %s to %s",
+            download_url,
+            file_download_path,
+        )
+
+        response = Downloader.request_file(download_url, validators)
+        if response is None:
+            return None
+
+        chunk_size = Downloader.chunk_size
+        with response:
+            with open(file_download_path, "wb", buffering=chunk_size) as file:
+                Downloader.preallocate_file(file, response)
+                Downloader.write_response(response, file)
+
+        logger.info("Downloaded %s", download_url)
+        state_entry = Downloader.get_validators(response)
+        state_entry["outputs"] = [file_download_path]
+        return state_entry
+
+    def download_archive(
+        self: "Downloader",
+        download_url: str,
+        destination: os.path,
+        validators: dict = None,
+    ) -> dict:
+        """
+        Downloads a zip archive and extracts it to the given folder.
+
+        The archive is held in a spooled temporary file instead of being
+        written next to the files extracted from it. Archives smaller
+        than `spool_max_size` never touch the disk, larger ones spill to
+        the temporary directory. Every download worker may be extracting
+        at once, so both the spool size and the extraction threads per
+        archive (`unzip_workers`) are kept small.
+
+        Args:
+            download_url: A string representing the URL of the archive.
+            destination: A string representing the path to the folder the
+            archive is extracted to.
+            validators: The "ETag" and "Last-Modified" headers of the last
+            download of the URL, if any.
+
+        Returns:
+            The "ETag" and "Last-Modified" headers of the response, and
+            the "outputs" list of files extracted from the archive, or
+            None if the archive has not changed since the last download.
+        """
+        logger.debug(
+            "Downloading archive from %s to %s", download_url, destination
+        )
+        response = Downloader.request_file(download_url, validators)
+        if response is None:
+            return None
+
+        with tempfile.SpooledTemporaryFile(
+            max_size=Downloader.spool_max_size
+        ) as archive:
+            with response:
+                Downloader.write_response(response, archive)
+            logger.info("Downloaded %s", download_url)
+            outputs = unzipper.Unzipper.unzip(
+                archive, destination, Downloader.unzip_workers
+            )
+
+        state_entry = Downloader.get_validators(response)
+        state_entry["outputs"] = outputs
+        return state_entry
+
+    @staticmethod
+    def request_file(
+        download_url: str, validators: dict = None
+    ) -> requests.Response:
+        """
+        Sends a streamed, conditional request for the given URL.
+
+        Args:
+            download_url: A string representing the URL to request.
+            validators: The "ETag" and "Last-Modified" headers of the last
+            download of the URL, if any.
+
+        Returns:
+            The streamed response, or None if the file has not changed
+            since the last download.
+
+        Raises:
+            requests.HTTPError: If the server answers with an error.
+        """
+        headers = {}
+        validators = validators or {}
+        if validators.get("ETag"):
+            headers["If-None-Match"] = validators["ETag"]
+        if validators.get("Last-Modified"):
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        response = Downloader.get_session().get(
+            download_url,
+            headers=headers,
+            stream=True,
+            timeout=Downloader.timeout,
+        )
+        if response.status_code == 304:
+            response.close()
+            logger.info("%s has not changed, skipping", download_url)
+            return None
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
+
+    @staticmethod
+    def write_response(response: requests.Response, file) -> None:
+        """
+        Writes a streamed response body to a file in fixed size chunks.
+
+        Args:
+            response: The streamed response to write.
+            file: The open binary file to write the body to.
+        """
+        for chunk in response.iter_content(Downloader.chunk_size):
+            file.write(chunk)
+
+    @staticmethod
+    def get_validators(response: requests.Response) -> dict:
+        """
+        Returns the validators of a response, for the next download.
+
+        Args:
+            response: The response of a download.
+
+        Returns:
+            The "ETag" and "Last-Modified" headers of the response.
+        """
+        return {
+            "ETag": response.headers.get("ETag", ""),
+            "Last-Modified": response.headers.get("Last-Modified", ""),
+        }
+
+    @staticmethod
+    def preallocate_file(file, response: requests.Response) -> None:
+        """
+        Reserves disk space for a download before it is written.
+
+        The space is only reserved when the response states its length
+        and is not content encoded, because the length of an encoded body
+        is not the length of the file written to disk. Platforms and
+        filesystems without fallocate support are left alone.
+
+        Args:
+            file: The open binary file the download is written to.
+            response: The streamed response being downloaded.
+        """
+        content_length = response.headers.get("Content-Length", "")
+        if not content_length.isdigit():
+            return
+        if response.headers.get("Content-Encoding"):
+            return
+        if not hasattr(os, "posix_fallocate"):
+            return
+        try:
+            os.posix_fallocate(file.fileno(), 0, int(content_length))
+        except OSError:
+            logger.debug("Could not preallocate %s", file.name)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_session() -> requests.Session:
+        """
+        Returns the HTTP session shared by all downloads.
+
+        The session keeps a pool of connections per host, so files from
+        the same county site reuse an open connection instead of opening
+        a new one each. Failed connections and server errors are retried
+        with a backoff.
+
+        Returns:
+            The shared requests session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=Downloader.max_workers,
+            pool_maxsize=Downloader.max_workers,
+            max_retries=Retry(
+                total=Downloader.max_retries,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def remove_unneeded_files(
         self: "Downloader", county: str, county_data_path: os.path
     ) -> None:
@@ -1,5 +1,10 @@
 """This module contains the GZIPConverter class."""
+import gzip
+import hashlib
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import yaml
 from ..helpers import downloader
@@ -10,11 +15,24 @@ from ..config import COLUMN_MAPPER
 class GZIPConverter:
     """This class handles file conversion to gzip format."""
 
+    delimiter_sniff_size: int = 1 << 16
+    chunk_size: int = 100_000
+    manifest_path: str = os.path.join(
+        downloader.Downloader.data_folder, "conversion_manifest.json"
+    )
+    fingerprint_block_size: int = 1 << 20
+    # Bump whenever clean_column or format_pid_column change the output,
+    # so files converted by an older version are converted again.
+    converter_version: int = 1
+
     @staticmethod
     def get_dataframe_file_paths() -> list:
         """
         Returns a list of paths to the dataframe files.
 
+        Files that are already in gzip format are left out, so they are
+        never handed to a conversion worker.
+
         Returns:
             A list of strings representing the paths to the dataframe files.
         """
@@ -25,6 +43,13 @@ class GZIPConverter:
         ):
             for file in files:
                 file_path = os.path.join(root, file)
+                if file.endswith(".gzip"):
+                    continue
+                if file_path in (
+                    GZIPConverter.manifest_path,
+                    downloader.Downloader.download_state_path,
+                ):
+                    continue
                 dataframe_file_paths.append(file_path)
         return dataframe_file_paths
 
@@ -33,53 +58,189 @@ class GZIPConverter:
         """
         Converts a list of dataframe files to gzip format.
 
+        The files are independent of each other, so they are converted in
+        parallel worker processes. The fingerprint of every converted file
+        is recorded in the conversion manifest, so files that have not
+        changed since the last run are not converted again.
+
         Args:
             dataframe_file_paths: A list of strings representing the paths to
             the dataframe files to convert.
         """
-        for file_path in dataframe_file_paths:
-            file_parent_directory = "/".join(file_path.split("/")[:-1])
-            file_type: str = file_path.split(".")[-1]
-            file_name: str = file_path.split(".")[0].split("/")[-1]
-            if "gzip" in file_type:
-                logger.info(
-                    "%s.%s already in gzip format, skipping conversion",
-                    file_name,
-                    file_type,
+        manifest: dict = GZIPConverter.load_manifest()
+        previous_fingerprints = [
+            manifest.get(file_path) for file_path in dataframe_file_paths
+        ]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            fingerprints = list(
+                executor.map(
+                    GZIPConverter.convert_file_to_gzip,
+                    dataframe_file_paths,
+                    previous_fingerprints,
                 )
-                continue
-            sep: str = GZIPConverter.determine_file_delimiter(
-                file_path, file_type
             )
 
-            file_destination = os.path.join(
-                file_parent_directory, f"{file_name}.gzip"
-            )
+        for file_path, fingerprint in zip(dataframe_file_paths, fingerprints):
+            if fingerprint is not None:
+                manifest[file_path] = fingerprint
+        GZIPConverter.save_manifest(manifest)
 
-            temporary_df: pd.DataFrame = GZIPConverter.open_df(
-                file_path, sep=sep
-            )
-            temporary_df.fillna("0", inplace=True)
-            temporary_df: pd.DataFrame = GZIPConverter.remove_df_blank_space(
-                temporary_df
-            )
-            temporary_df: pd.DataFrame = GZIPConverter.format_pid_column(
-                temporary_df
-            )
+    @staticmethod
+    def load_manifest() -> dict:
+        """
+        Loads the conversion manifest.
+
+        Returns:
+            A dictionary mapping the path of each converted file to its
+            fingerprint. The dictionary is empty if there is no manifest
+            yet, or if it can not be read.
+        """
+        try:
+            with open(
+                GZIPConverter.manifest_path, "r", encoding="utf-8"
+            ) as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            logger.info("No usable conversion manifest, converting all files")
+            return {}
+
+    @staticmethod
+    def save_manifest(manifest: dict) -> None:
+        """
+        Saves the conversion manifest.
+
+        Args:
+            manifest: A dictionary mapping the path of each converted file
+            to its fingerprint.
+        """
+        with open(
+            GZIPConverter.manifest_path, "w", encoding="utf-8"
+        ) as manifest_file:
+            json.dump(manifest, manifest_file, indent=4)
+
+    @staticmethod
+    def get_file_fingerprint(file_path: os.path) -> list:
+        """
+        Returns the fingerprint of a file.
 
-            temporary_df.to_csv(
-                file_destination, index=False, compression="gzip", sep=sep
+        The fingerprint is the size of the file and a hash of its content,
+        together with `converter_version` and a hash of the columns kept
+        for the file. A change to the converter or to the column mapping
+        therefore changes the fingerprint too. Modification times are not
+        used, because the source files are downloaded again on every run.
+
+        Args:
+            file_path: A string representing the path to the file.
+
+        Returns:
+            A list holding the converter version, the hex digest of the
+            columns to keep, the size of the file and the hex digest of its
+            content.
+        """
+        columns_to_keep = GZIPConverter.get_columns_to_keep(file_path)
+        columns_hash = hashlib.blake2b(
+            json.dumps(columns_to_keep).encode("utf-8"), digest_size=16
+        )
+        file_hash = hashlib.blake2b()
+        with open(file_path, "rb") as file:
+            while block := file.read(GZIPConverter.fingerprint_block_size):
+                file_hash.update(block)
+        return [
+            GZIPConverter.converter_version,
+            columns_hash.hexdigest(),
+            os.path.getsize(file_path),
+            file_hash.hexdigest(),
+        ]
+
+    @staticmethod
+    def convert_file_to_gzip(
+        file_path: os.path, previous_fingerprint: list = None
+    ) -> list:
+        """
+        Converts a single dataframe file to gzip format.
+
+        Text files are read, cleaned and written in chunks of
+        `chunk_size` rows, so peak memory is bound by the chunk size
+        rather than by the size of the file. If the file matches
+        `previous_fingerprint` and its gzip file already exists, the
+        conversion is skipped.
+
+        Args:
+            file_path: A string representing the path to the dataframe file
+            to convert.
+            previous_fingerprint: The fingerprint of the file the last time
+            it was converted, if any.
+
+        Returns:
+            The fingerprint of the file, or None if the file was already in
+            gzip format.
+        """
+        file_parent_directory = os.path.dirname(file_path)
+        file_name, file_extension = os.path.splitext(
+            os.path.basename(file_path)
+        )
+        file_type: str = file_extension.lstrip(".")
+        if "gzip" in file_type:
+            logger.info(
+                "%s.%s already in gzip format, skipping conversion",
+                file_name,
+                file_type,
             )
+            return None
+
+        fingerprint: list = GZIPConverter.get_file_fingerprint(file_path)
+        file_destination = os.path.join(
+            file_parent_directory, f"{file_name}.gzip"
+        )
+        if fingerprint == previous_fingerprint and os.path.exists(
+            file_destination
+        ):
             os.remove(file_path)
             logger.info(
-                "%s.%s converted to gzip successfully", file_name, file_type
+                "%s.%s unchanged since last conversion, skipping",
+                file_name,
+                file_type,
+            )
+            return fingerprint
+
+        sep: str = GZIPConverter.determine_file_delimiter(
+            file_path, file_type
+        )
+
+        if file_type == "xlsx":
+            dataframe_chunks = [GZIPConverter.open_df(file_path)]
+        else:
+            dataframe_chunks = GZIPConverter.open_df(
+                file_path, sep=sep, chunksize=GZIPConverter.chunk_size
             )
 
+        with gzip.open(
+            file_destination, "wt", compresslevel=1, newline=""
+        ) as file:
+            for chunk_number, temporary_df in enumerate(dataframe_chunks):
+                temporary_df: pd.DataFrame = GZIPConverter.clean_df(
+                    temporary_df
+                )
+                temporary_df: pd.DataFrame = GZIPConverter.format_pid_column(
+                    temporary_df
+                )
+                temporary_df.to_csv(
+                    file, index=False, sep=sep, header=chunk_number == 0
+                )
+        os.remove(file_path)
+        logger.info(
+            "%s.%s converted to gzip successfully", file_name, file_type
+        )
+        return fingerprint
+
     @staticmethod
     def determine_file_delimiter(file_path: os.path, file_type: str) -> str:
         """
         Determines the delimiter for a text file.
 
+        Only the start of the file is read, which is enough to see the
+        delimiter in the header row without loading the whole file.
+
         Args:
             file_path: A string representing the path to the text file.
             file_type: A string representing the type of the text file.
@@ -90,49 +251,55 @@ class GZIPConverter:
         logger.info("Determining delimiter for %s", file_path)
         sep: str = ","
         if file_type == "txt":
-            with open(file_path, "r", encoding="latin1") as file:
-                if "|" in file.read():
+            with open(file_path, "rb") as file:
+                if b"|" in file.read(GZIPConverter.delimiter_sniff_size):
                     sep: str = "|"
         return sep
 
     @staticmethod
     def open_df(
-        file_path: os.path, compression_type: str = "", sep: str = ","
+        file_path: os.path,
+        compression_type: str = "",
+        sep: str = ",",
+        chunksize: int = None,
+        usecols: list = None,
     ) -> pd.DataFrame:
         """
         Opens a dataframe from the given text file.
 
+        Uncompressed files are read with only the columns listed for them
+        in the column mapping, so unused columns are never parsed.
+
         Args:
             file_path: A string representing the path to the text file.
             sep: A string representing the delimiter used in the text file.
+            chunksize: The number of rows per chunk when reading an
+            uncompressed text file in chunks. When given, an iterator of
+            dataframes is returned instead of a single dataframe.
+            usecols: The columns to read from a compressed text file. All
+            columns are read when not given.
 
         Returns:
             A pandas dataframe representing the contents of the text file.
         """
         logger.info("Opening dataframe from %s", file_path)
 
-        if str(file_path).endswith("xlsx"):
-            dataframe = pd.read_excel(file_path, dtype=str)
-            logger.info("Dataframe opened from %s", file_path)
-            return dataframe
-
         if compression_type:
             dataframe = pd.read_csv(
-                file_path, dtype=str, sep=sep, compression=compression_type
+                file_path,
+                dtype=str,
+                sep=sep,
+                compression=compression_type,
+                usecols=usecols,
             )
             logger.info("Dataframe opened from %s", file_path)
             return dataframe
 
         columns_to_keep = GZIPConverter.get_columns_to_keep(file_path)
 
-        if not columns_to_keep:
-            dataframe = pd.read_csv(
-                file_path,
-                encoding="latin1",
-                on_bad_lines="skip",
-                dtype=str,
-                sep=sep,
-                skipinitialspace=True,
+        if str(file_path).endswith("xlsx"):
+            dataframe = pd.read_excel(
+                file_path, dtype=str, usecols=columns_to_keep or None
             )
             logger.info("Dataframe opened from %s", file_path)
             return dataframe
@@ -144,28 +311,48 @@ class GZIPConverter:
             dtype=str,
             sep=sep,
             skipinitialspace=True,
-            usecols=columns_to_keep,
+            usecols=columns_to_keep or None,
+            chunksize=chunksize,
         )
         logger.info("Dataframe opened from %s", file_path)
         return dataframe
 
     @staticmethod
-    def remove_df_blank_space(dataframe: pd.DataFrame) -> pd.DataFrame:
+    def clean_df(dataframe: pd.DataFrame) -> pd.DataFrame:
         """
-        Removes blank spaces from the given dataframe.
+        Fills missing values and removes blank spaces from the given
+        dataframe.
+
+        Missing values and cells that hold the literal string "nan" are
+        replaced with "0". All of the cleaning is done column by column in
+        a single pass, instead of one pass over the whole dataframe per
+        step.
 
         Args:
-            dataframe: A pandas dataframe to remove blank spaces from.
+            dataframe: A pandas dataframe to clean.
 
         Returns:
-            A pandas dataframe with blank spaces removed.
+            A pandas dataframe with missing values filled and blank spaces
+            removed.
         """
-        for column in dataframe.columns:
-            dataframe[column] = dataframe[column].str.strip()
-            dataframe[column] = dataframe[column].str.replace("nan", "0")
-        logger.info("Blank spaces removed from dataframe.")
+        dataframe = dataframe.apply(GZIPConverter.clean_column)
+        logger.debug("Blank spaces removed from dataframe.")
         return dataframe
 
+    @staticmethod
+    def clean_column(column: pd.Series) -> pd.Series:
+        """
+        Fills missing values and removes blank spaces from a column.
+
+        Args:
+            column: A pandas series of strings to clean.
+
+        Returns:
+            A pandas series with missing values filled and blank spaces
+            removed.
+        """
+        return column.fillna("0").str.strip().replace("nan", "0")
+
     @staticmethod
     def format_pid_column(dataframe: pd.DataFrame) -> pd.DataFrame:
         """
@@ -177,7 +364,7 @@ class GZIPConverter:
         Returns:
             A pandas dataframe with the Parcel ID column formatted.
         """
-        logger.info("Formatting Parcel ID column")
+        logger.debug("Formatting Parcel ID column")
         columns_to_check = [
             "account",
             "Parcel ID",
@@ -205,13 +392,26 @@ class GZIPConverter:
             A list of strings representing the names of the columns to keep.
         """
         logger.info("Getting columns to keep for %s", file_path)
-        columns_to_keep = []
-        with open(COLUMN_MAPPER, "r", encoding="utf-8") as yaml_file:
-            column_mapping = yaml.safe_load(yaml_file)
-
+        column_mapping = GZIPConverter.get_column_mapping()
         file_name = os.path.basename(file_path).lower()
-        if file_name in column_mapping:
-            columns_to_keep = column_mapping[file_name]
+        columns_to_keep = column_mapping.get(file_name, [])
 
         logger.info("Columns to keep for %s: %s", file_path, columns_to_keep)
         return columns_to_keep
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_column_mapping() -> dict:
+        """
+        Returns the column mapping of every text file.
+
+        The mapping file is parsed once per process, with the libyaml
+        loader when it is available.
+
+        Returns:
+            A dictionary mapping each lower case file name to the list of
+            columns to keep.
+        """
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(COLUMN_MAPPER, "r", encoding="utf-8") as yaml_file:
+            return yaml.load(yaml_file, Loader=loader)
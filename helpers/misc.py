@@ -4,11 +4,13 @@ functions, including a function to convert strings to a standardized
 format.
 
 Functions:
-- convert_to_string(string: Union[str, pandas.Series]) -> str: Converts
-a string to uppercase, removes leading zeros and whitespace, and returns
-the result. Accepts a pandas Series object as input as well.
+- convert_to_string(string: Union[str, float, pandas.Series]) -> str:
+Converts a string to uppercase, removes leading zeros and whitespace,
+and returns the result. Accepts a pandas Series object, or the float NaN
+of a missing dataframe cell, as input as well. Missing values convert
+to an empty string.
 """
-from pandas import Series
+from pandas import Series, isna
 
 
 def convert_to_string(string: str) -> str:
@@ -17,19 +19,24 @@ def convert_to_string(string: str) -> str:
     whitespace, and returns the result.
 
     Args:
-        string (str or pandas.Series): A string to be converted.
+        string (str, float or pandas.Series): A string to be converted.
+        A float is the NaN pandas uses for a missing cell.
 
     Returns:
         str: The input string converted to uppercase, with leading zeros
-        and whitespace removed.
+        and whitespace removed, or an empty string for a missing value.
 
     Raises:
-        TypeError: If the input argument is not a string or a pandas
-        Series.
+        TypeError: If the input argument is not a string, a float or a
+        pandas Series.
     """
     if isinstance(string, Series):
         string = string.item()
-    elif not isinstance(string, str):
-        raise TypeError(f"Expected str or pandas.Series, got {type(string)}")
+    elif not isinstance(string, (str, float)):
+        raise TypeError(
+            f"Expected str, float or pandas.Series, got {type(string)}"
+        )
+    if isna(string):
+        return ""
     string = str(string)
     return string.upper().lstrip('0').strip()
@@ -1,26 +1,110 @@
 '''This module contains the Unzipper class.'''
 import os
-from zipfile import ZipFile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZipFile, ZipInfo
 from ..logger import logger
 
 
 class Unzipper:
     '''This class handles zip file extraction'''
+
+    max_workers: int = 8
+    chunk_size: int = 1 << 20
+
     @staticmethod
-    def unzip(file_download_path: os.path, destination: os.path) -> None:
+    def unzip(
+        archive, destination: os.path, max_workers: int = None
+    ) -> list:
         """
         Unzips the given file to the specified destination.
 
+        The archive members are extracted in parallel threads. zlib
+        releases the GIL while inflating, so large members no longer
+        decompress one after the other on a single core.
+
+        Args:
+            archive: An open binary file object holding the archive. It
+            is left open for the caller to close.
+            destination: A string representing the path to the
+            destination folder.
+            max_workers: The most threads to extract members with.
+            Defaults to `max_workers`.
+
+        Returns:
+            A list of the paths of the extracted files.
+        """
+        logger.info('Unzipping archive to %s', destination)
+        with ZipFile(archive, 'r') as zip_object:
+            members = []
+            for member in zip_object.infolist():
+                target_path = Unzipper.get_member_path(member, destination)
+                if member.is_dir():
+                    os.makedirs(target_path, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                members.append((member, target_path))
+
+            max_workers = max(
+                1, min(max_workers or Unzipper.max_workers, len(members))
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        Unzipper.extract_member,
+                        zip_object,
+                        member,
+                        target_path,
+                    )
+                    for member, target_path in members
+                ]
+                for future in futures:
+                    future.result()
+
+        logger.info('Finished unzipping archive to %s', destination)
+        return [target_path for _, target_path in members]
+
+    @staticmethod
+    def get_member_path(member: ZipInfo, destination: os.path) -> os.path:
+        """
+        Returns the path a zip archive member is extracted to.
+
         Args:
-            file_download_path: A string representing the path to the
-            file to unzip.
+            member: The ZipInfo of the archive member.
             destination: A string representing the path to the
             destination folder.
+
+        Returns:
+            A string representing the path to extract the member to.
+
+        Raises:
+            ValueError: If the member would be extracted outside of the
+            destination folder.
         """
-        logger.info('Unzipping %s to %s', file_download_path, destination)
-        with ZipFile(file_download_path, 'r') as zip_object:
-            zip_object.extractall(destination)
+        destination = os.path.abspath(destination)
+        target_path = os.path.abspath(
+            os.path.join(destination, member.filename)
+        )
+        if os.path.commonpath([destination, target_path]) != destination:
+            raise ValueError(
+                f'Zip member {member.filename!r} is outside of {destination}'
+            )
+        return target_path
 
-        if os.path.exists(file_download_path):
-            os.remove(file_download_path)
-        logger.info('Finished unzipping %s', file_download_path)
+    @staticmethod
+    def extract_member(
+        zip_object: ZipFile, member: ZipInfo, target_path: os.path
+    ) -> None:
+        """
+        Extracts a single archive member to the given path.
+
+        Args:
+            zip_object: The open ZipFile the member belongs to.
+            member: The ZipInfo of the archive member to extract.
+            target_path: A string representing the path to write the
+            member to.
+        """
+        logger.debug('Extracting %s to %s', member.filename, target_path)
+        with zip_object.open(member) as source:
+            with open(target_path, 'wb') as target:
+                shutil.copyfileobj(source, target, Unzipper.chunk_size)
@@ -24,7 +24,7 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-file_handler = logging.FileHandler('myapp.log')
+file_handler = logging.FileHandler('myapp.log', delay=True)
 file_handler.setLevel(logging.DEBUG)
 
 formatter = logging.Formatter(